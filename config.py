@@ -38,11 +38,18 @@ except ImportError:
 os.environ.setdefault("POSTHOG_API_KEY", POSTHOG_API_KEY)
 os.environ.setdefault("POSTHOG_PROJECT_ID", POSTHOG_PROJECT_ID)
 
+# Argon2 cost settings, shared by hash_new_password and the dashboard's password check
+ARGON2_SETTINGS = {"time_cost": 2, "memory_cost": 19456, "parallelism": 1}
+
 # Password utility function
 def hash_new_password(password):
-    """Utility function to generate password hash for new users"""
-    import hashlib
-    return hashlib.sha256(password.encode()).hexdigest()
+    """Utility function to generate an Argon2 password hash for new users (needs argon2-cffi)"""
+    try:
+        from argon2 import PasswordHasher
+    except ImportError:
+        # Never hand out a weak hash silently
+        raise ImportError("argon2-cffi is required to hash new passwords: pip install argon2-cffi") from None
+    return PasswordHasher(**ARGON2_SETTINGS).hash(password)
 
 # Example usage:
 # print(f"Hash for 'mypassword': {hash_new_password('mypassword')}") 
\ No newline at end of file
@@ -3,6 +3,7 @@ import csv
 import re
 import json
 import sys
+import time
 import argparse
 
 # === CONFIG ===
@@ -14,48 +15,8 @@ DEFAULT_SESSION_ID = "0197a378-6343-73cc-af1e-873f9e6f8fb7"  # Default session I
 EVENT_NAME = "Motor Data"  # Event name - always Motor Data
 INSTANCE_URL = "https://us.posthog.com"
 
-# === PARSE COMMAND LINE ARGUMENTS ===
-parser = argparse.ArgumentParser(description='Download Motor Data events from PostHog for a specific person')
-parser.add_argument('--person-id', '-p', 
-                   default=DEFAULT_PERSON_ID,
-                   help=f'Person ID to fetch Motor Data for (default: {DEFAULT_PERSON_ID})')
-parser.add_argument('--session-id', '-s',
-                   default=DEFAULT_SESSION_ID, 
-                   help=f'Session ID (optional, default: {DEFAULT_SESSION_ID})')
-parser.add_argument('--timestamp', '-t',
-                   help='Specific timestamp to fetch (ISO format, e.g., 2024-01-15T10:30:00Z)')
-parser.add_argument('--interactive', '-i',
-                   action='store_true',
-                   help='Interactive mode - prompt for person ID and event selection')
-parser.add_argument('--list-events', '-l',
-                   action='store_true',
-                   help='List all Motor Data events for the person with timestamps')
-
-args = parser.parse_args()
-
-# === DETERMINE PERSON ID ===
-if args.interactive:
-    print("🔧 Interactive mode - enter person details:")
-    PERSON_ID = input(f"Enter Person ID (default: {DEFAULT_PERSON_ID}): ").strip()
-    if not PERSON_ID:
-        PERSON_ID = DEFAULT_PERSON_ID
-    
-    SESSION_ID = input(f"Enter Session ID (optional, default: {DEFAULT_SESSION_ID}): ").strip()
-    if not SESSION_ID:
-        SESSION_ID = DEFAULT_SESSION_ID
-else:
-    PERSON_ID = args.person_id
-    SESSION_ID = args.session_id if args.session_id and args.session_id.strip() else None
-
-TARGET_TIMESTAMP = args.timestamp
-
-print(f"🎯 Fetching Motor Data events for Person ID: {PERSON_ID}")
-print(f"📋 Session ID: {SESSION_ID}")
-if TARGET_TIMESTAMP:
-    print(f"🕒 Target Timestamp: {TARGET_TIMESTAMP}")
-elif args.list_events:
-    print("📋 Will list all available Motor Data events")
-print()
+CATEGORIES = ['power', 'torque', 'motor_temp', 'mosfet_temp', 'mosfet_cooldown', 'motor_cooldown']
+REQUEST_TIMEOUT = 30  # seconds per PostHog API request
 
 # === DISCOVER PROJECTS FIRST ===
 headers = {
@@ -63,10 +24,24 @@ headers = {
     "Content-Type": "application/json"
 }
 
-# Skip project discovery to avoid permission issues - we already know our project ID
-print("🔍 Using configured project ID (skipping discovery to avoid permission issues)...")
-print(f"✅ Using PROJECT_ID: {PROJECT_ID}")
+# Shared session so requests from concurrent dashboard sessions reuse pooled connections
+session = requests.Session()
+session.headers.update(headers)
+session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=32))
 
+def get_with_retry(url, retries=2):
+    """GET url on the shared session, waiting out rate limits (HTTP 429 + Retry-After)"""
+    for attempt in range(retries + 1):
+        response = session.get(url, timeout=REQUEST_TIMEOUT)
+        if response.status_code != 429 or attempt == retries:
+            return response
+        try:
+            delay = float(response.headers.get("Retry-After", 1))
+        except ValueError:
+            delay = 1
+        time.sleep(min(delay, REQUEST_TIMEOUT))
+
+# Skip project discovery to avoid permission issues - we already know our project ID
 # Commenting out project discovery as it requires additional permissions
 # and we already have the correct project ID configured
 """
@@ -99,8 +74,6 @@ except Exception as e:
     print(f"❌ Error fetching projects: {str(e)}")
 """
 
-print()
-
 # === FETCH EVENT DATA ===
 
 def fetch_motor_data_events(person_id, session_id=None, limit=200):
@@ -142,7 +115,7 @@ def fetch_motor_data_events(person_id, session_id=None, limit=200):
         print(f"🔍 Trying endpoint: {url}")
         
         try:
-            response = requests.get(url, headers=headers)
+            response = get_with_retry(url)
             print(f"   Status: {response.status_code}")
             
             if response.status_code == 200:
@@ -165,7 +138,7 @@ def fetch_motor_data_events(person_id, session_id=None, limit=200):
                         while next_url and page_count < 5:
                             print(f"   📄 Fetching page {page_count + 1}...")
                             try:
-                                next_response = requests.get(next_url, headers=headers)
+                                next_response = get_with_retry(next_url)
                                 if next_response.status_code == 200:
                                     next_data = next_response.json()
                                     if 'results' in next_data:
@@ -221,111 +194,73 @@ def fetch_motor_data_events(person_id, session_id=None, limit=200):
     
     return [], None
 
-# Fetch all Motor Data events for the person
-motor_events, successful_url = fetch_motor_data_events(PERSON_ID, SESSION_ID)
-
-# === SELECT AND PROCESS ALL EVENTS ===
-if not motor_events:
-    print("❌ Failed to fetch Motor Data events. Please check:")
-    print("1. API key permissions (needs 'query:read' scope)")
-    print("2. Project ID")
-    print("3. Person ID") 
-    print("4. Event name ('Motor Data')")
-    print("5. Network connectivity")
-    exit(1)
-
-print(f"✅ Successfully fetched {len(motor_events)} Motor Data events from: {successful_url}")
-
-# === FILTER BY SPECIFIC TIMESTAMP IF PROVIDED ===
-if TARGET_TIMESTAMP:
-    print(f"🔍 Filtering for specific timestamp: {TARGET_TIMESTAMP}")
-    original_count = len(motor_events)
-    
-    # Filter events to find the one with matching timestamp
+def filter_events_by_timestamp(motor_events, target_timestamp):
+    """Return the events whose timestamp matches target_timestamp"""
     filtered_events = []
+    # Seconds-precision prefix, sliced once instead of per event
+    target_prefix = target_timestamp[:19]
     for event in motor_events:
         event_timestamp = event.get('timestamp', '')
         # Try exact match first
-        if event_timestamp == TARGET_TIMESTAMP:
+        if event_timestamp == target_timestamp:
             filtered_events.append(event)
-        # Also try partial match (in case of precision differences)
-        elif TARGET_TIMESTAMP in event_timestamp or event_timestamp.startswith(TARGET_TIMESTAMP[:19]):
+        # Also try partial match (in case of precision differences); the cheap prefix check goes first
+        elif event_timestamp.startswith(target_prefix) or target_timestamp in event_timestamp:
             filtered_events.append(event)
-    
-    if filtered_events:
-        motor_events = filtered_events
-        print(f"✅ Found {len(filtered_events)} event(s) matching timestamp {TARGET_TIMESTAMP}")
-    else:
-        print(f"❌ No event found with timestamp matching: {TARGET_TIMESTAMP}")
-        print(f"📋 Available timestamps from {original_count} events:")
-        for i, event in enumerate(motor_events[:10]):  # Show first 10
-            print(f"   - {event.get('timestamp', 'Unknown')}")
-        if len(motor_events) > 10:
-            print(f"   ... and {len(motor_events) - 10} more")
-        exit(1)
-
-# === LIST EVENTS IF REQUESTED ===
-if args.list_events:
-    print(f"\n📋 Found {len(motor_events)} Motor Data events:")
-    for i, event in enumerate(motor_events):
-        timestamp = event.get('timestamp', 'Unknown')
-        properties_count = len(event.get('properties', {}))
-        session_id = event.get('properties', {}).get('$session_id', 'Unknown')
-        print(f"   {i+1}. {timestamp} (Session: {session_id}, {properties_count} properties)")
-    exit(0)
+    return filtered_events
 
-# === PROCESS ALL EVENTS ===
-all_power_data = []
-all_torque_data = []
-all_motor_temp_data = []
-all_mosfet_temp_data = []
-all_mosfet_cooldown_data = []
-all_motor_cooldown_data = []
+def summarize_events(motor_events, min_properties=0, max_properties=None):
+    """Return timestamp, session ID and property count for each event within the property count range"""
+    summaries = []
+    for event in motor_events:
+        properties = event.get('properties', {})
+        properties_count = len(properties)
+        # Skip out-of-range events before building their summary
+        if properties_count < min_properties or (max_properties is not None and properties_count > max_properties):
+            continue
+        summaries.append({
+            'timestamp': event.get('timestamp', 'Unknown'),
+            'session_id': properties.get('$session_id', 'Unknown'),
+            'properties_count': properties_count
+        })
+    return summaries
 
-for data in motor_events:
-    event_properties = data.get("properties", {})
-    timestamp = data.get("timestamp", "")
-    if not event_properties:
-        continue
-    # Initialize categorized dictionaries for this event
-    power_data = {"timestamp": timestamp}
-    torque_data = {"timestamp": timestamp}
-    motor_temp_data = {"timestamp": timestamp}
-    mosfet_temp_data = {"timestamp": timestamp}
-    mosfet_cooldown_data = {"timestamp": timestamp}
-    motor_cooldown_data = {"timestamp": timestamp}
-    # Categorize properties
-    for key, value in event_properties.items():
-        key_lower = key.lower()
-        if key_lower.startswith('power'):
-            power_data[key] = value
-        elif key_lower.startswith('torque'):
-            torque_data[key] = value
-        elif 'motortemp' in key_lower:
-            motor_temp_data[key] = value
-        elif 'mosfettemp' in key_lower and 'cooldown' not in key_lower:
-            mosfet_temp_data[key] = value
-        elif 'mosfet' in key_lower and 'cooldown' in key_lower:
-            mosfet_cooldown_data[key] = value
-        elif 'cooldownmosfet' in key_lower:
-            mosfet_cooldown_data[key] = value
-        elif 'motor' in key_lower and 'cooldown' in key_lower:
-            motor_cooldown_data[key] = value
-        elif 'cooldownmotor' in key_lower:
-            motor_cooldown_data[key] = value
-    # Append to lists if there is data beyond timestamp
-    if len(power_data) > 1:
-        all_power_data.append(power_data)
-    if len(torque_data) > 1:
-        all_torque_data.append(torque_data)
-    if len(motor_temp_data) > 1:
-        all_motor_temp_data.append(motor_temp_data)
-    if len(mosfet_temp_data) > 1:
-        all_mosfet_temp_data.append(mosfet_temp_data)
-    if len(mosfet_cooldown_data) > 1:
-        all_mosfet_cooldown_data.append(mosfet_cooldown_data)
-    if len(motor_cooldown_data) > 1:
-        all_motor_cooldown_data.append(motor_cooldown_data)
+def categorize_events(motor_events):
+    """Split each event's properties into per-category rows keyed by category name"""
+    categorized = {category: [] for category in CATEGORIES}
+    
+    for data in motor_events:
+        event_properties = data.get("properties", {})
+        timestamp = data.get("timestamp", "")
+        if not event_properties:
+            continue
+        # Initialize categorized dictionaries for this event
+        rows = {category: {"timestamp": timestamp} for category in CATEGORIES}
+        # Categorize properties
+        for key, value in event_properties.items():
+            key_lower = key.lower()
+            if key_lower.startswith('power'):
+                rows['power'][key] = value
+            elif key_lower.startswith('torque'):
+                rows['torque'][key] = value
+            elif 'motortemp' in key_lower:
+                rows['motor_temp'][key] = value
+            elif 'mosfettemp' in key_lower and 'cooldown' not in key_lower:
+                rows['mosfet_temp'][key] = value
+            elif 'mosfet' in key_lower and 'cooldown' in key_lower:
+                rows['mosfet_cooldown'][key] = value
+            elif 'cooldownmosfet' in key_lower:
+                rows['mosfet_cooldown'][key] = value
+            elif 'motor' in key_lower and 'cooldown' in key_lower:
+                rows['motor_cooldown'][key] = value
+            elif 'cooldownmotor' in key_lower:
+                rows['motor_cooldown'][key] = value
+        # Append to lists if there is data beyond timestamp
+        for category, row in rows.items():
+            if len(row) > 1:
+                categorized[category].append(row)
+    
+    return categorized
 
 # === WRITE ALL EVENTS TO CSV FILES ===
 def write_all_events_to_csv(filename, data_list):
@@ -344,14 +279,142 @@ def write_all_events_to_csv(filename, data_list):
             writer.writerow(row)
     print(f"✅ Saved {len(data_list)} events to {filename}")
 
-write_all_events_to_csv("csv_outputs/posthog_event_power.csv", all_power_data)
-write_all_events_to_csv("csv_outputs/posthog_event_torque.csv", all_torque_data)
-write_all_events_to_csv("csv_outputs/posthog_event_motor_temp.csv", all_motor_temp_data)
-write_all_events_to_csv("csv_outputs/posthog_event_mosfet_temp.csv", all_mosfet_temp_data)
-write_all_events_to_csv("csv_outputs/posthog_event_mosfet_cooldown.csv", all_mosfet_cooldown_data)
-write_all_events_to_csv("csv_outputs/posthog_event_motor_cooldown.csv", all_motor_cooldown_data)
+def run(person_id=DEFAULT_PERSON_ID, session_id=None, timestamp=None, list_only=False,
+        min_properties=0, max_properties=None):
+    """Fetch Motor Data events in-process.
+    
+    Returns (True, summaries) when list_only is set, (True, categorized rows) otherwise,
+    or (False, error message) on failure. min_properties/max_properties limit the listed events.
+    """
+    motor_events, _ = fetch_motor_data_events(person_id, session_id)
+    if not motor_events:
+        return False, "Failed to fetch Motor Data events"
+    
+    if timestamp:
+        motor_events = filter_events_by_timestamp(motor_events, timestamp)
+        if not motor_events:
+            return False, f"No event found with timestamp matching: {timestamp}"
+    
+    if list_only:
+        return True, summarize_events(motor_events, min_properties, max_properties)
+    return True, categorize_events(motor_events)
+
+def run_for_timestamps(person_id, timestamps, session_id=None):
+    """Fetch the person's Motor Data events once and categorize the event(s) at each timestamp.
+    
+    Returns (True, {timestamp: categorized rows, or None when no event matches})
+    or (False, error message) when the events could not be fetched.
+    """
+    motor_events, _ = fetch_motor_data_events(person_id, session_id)
+    if not motor_events:
+        return False, "Failed to fetch Motor Data events"
+    
+    results = {}
+    for timestamp in timestamps:
+        matching_events = filter_events_by_timestamp(motor_events, timestamp)
+        results[timestamp] = categorize_events(matching_events) if matching_events else None
+    return True, results
+
+def main():
+    # === PARSE COMMAND LINE ARGUMENTS ===
+    parser = argparse.ArgumentParser(description='Download Motor Data events from PostHog for a specific person')
+    parser.add_argument('--person-id', '-p', 
+                       default=DEFAULT_PERSON_ID,
+                       help=f'Person ID to fetch Motor Data for (default: {DEFAULT_PERSON_ID})')
+    parser.add_argument('--session-id', '-s',
+                       default=DEFAULT_SESSION_ID, 
+                       help=f'Session ID (optional, default: {DEFAULT_SESSION_ID})')
+    parser.add_argument('--timestamp', '-t',
+                       help='Specific timestamp to fetch (ISO format, e.g., 2024-01-15T10:30:00Z)')
+    parser.add_argument('--interactive', '-i',
+                       action='store_true',
+                       help='Interactive mode - prompt for person ID and event selection')
+    parser.add_argument('--list-events', '-l',
+                       action='store_true',
+                       help='List all Motor Data events for the person with timestamps')
+    
+    args = parser.parse_args()
+    
+    # === DETERMINE PERSON ID ===
+    if args.interactive:
+        print("🔧 Interactive mode - enter person details:")
+        PERSON_ID = input(f"Enter Person ID (default: {DEFAULT_PERSON_ID}): ").strip()
+        if not PERSON_ID:
+            PERSON_ID = DEFAULT_PERSON_ID
+        
+        SESSION_ID = input(f"Enter Session ID (optional, default: {DEFAULT_SESSION_ID}): ").strip()
+        if not SESSION_ID:
+            SESSION_ID = DEFAULT_SESSION_ID
+    else:
+        PERSON_ID = args.person_id
+        SESSION_ID = args.session_id if args.session_id and args.session_id.strip() else None
+    
+    TARGET_TIMESTAMP = args.timestamp
+    
+    print(f"🎯 Fetching Motor Data events for Person ID: {PERSON_ID}")
+    print(f"📋 Session ID: {SESSION_ID}")
+    if TARGET_TIMESTAMP:
+        print(f"🕒 Target Timestamp: {TARGET_TIMESTAMP}")
+    elif args.list_events:
+        print("📋 Will list all available Motor Data events")
+    print()
+    
+    print("🔍 Using configured project ID (skipping discovery to avoid permission issues)...")
+    print(f"✅ Using PROJECT_ID: {PROJECT_ID}")
+    print()
+    
+    # Fetch all Motor Data events for the person
+    motor_events, successful_url = fetch_motor_data_events(PERSON_ID, SESSION_ID)
+    
+    # === SELECT AND PROCESS ALL EVENTS ===
+    if not motor_events:
+        print("❌ Failed to fetch Motor Data events. Please check:")
+        print("1. API key permissions (needs 'query:read' scope)")
+        print("2. Project ID")
+        print("3. Person ID") 
+        print("4. Event name ('Motor Data')")
+        print("5. Network connectivity")
+        sys.exit(1)
+    
+    print(f"✅ Successfully fetched {len(motor_events)} Motor Data events from: {successful_url}")
+    
+    # === FILTER BY SPECIFIC TIMESTAMP IF PROVIDED ===
+    if TARGET_TIMESTAMP:
+        print(f"🔍 Filtering for specific timestamp: {TARGET_TIMESTAMP}")
+        original_count = len(motor_events)
+        
+        # Filter events to find the one with matching timestamp
+        filtered_events = filter_events_by_timestamp(motor_events, TARGET_TIMESTAMP)
+        
+        if filtered_events:
+            motor_events = filtered_events
+            print(f"✅ Found {len(filtered_events)} event(s) matching timestamp {TARGET_TIMESTAMP}")
+        else:
+            print(f"❌ No event found with timestamp matching: {TARGET_TIMESTAMP}")
+            print(f"📋 Available timestamps from {original_count} events:")
+            for i, event in enumerate(motor_events[:10]):  # Show first 10
+                print(f"   - {event.get('timestamp', 'Unknown')}")
+            if len(motor_events) > 10:
+                print(f"   ... and {len(motor_events) - 10} more")
+            sys.exit(1)
+    
+    # === LIST EVENTS IF REQUESTED ===
+    if args.list_events:
+        print(f"\n📋 Found {len(motor_events)} Motor Data events:")
+        for i, event in enumerate(summarize_events(motor_events)):
+            print(f"   {i+1}. {event['timestamp']} (Session: {event['session_id']}, {event['properties_count']} properties)")
+        sys.exit(0)
+    
+    # === PROCESS ALL EVENTS ===
+    categorized = categorize_events(motor_events)
+    
+    for category in CATEGORIES:
+        write_all_events_to_csv(f"csv_outputs/posthog_event_{category}.csv", categorized[category])
+    
+    # === SUMMARY ===
+    total_properties = sum(len(event.get('properties', {})) for event in motor_events)
+    categorized_properties = sum(len(row)-1 for rows in categorized.values() for row in rows)
+    print(f"\n📊 Summary: {categorized_properties}/{total_properties} properties categorized across all events")
 
-# === SUMMARY ===
-total_properties = sum(len(event.get('properties', {})) for event in motor_events)
-categorized_properties = sum(len(row)-1 for row in all_power_data + all_torque_data + all_motor_temp_data + all_mosfet_temp_data + all_mosfet_cooldown_data + all_motor_cooldown_data)
-print(f"\n📊 Summary: {categorized_properties}/{total_properties} properties categorized across all events")
+if __name__ == "__main__":
+    main()
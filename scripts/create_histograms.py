@@ -6,12 +6,18 @@ Sums all values across all events for each index
 
 import os
 import pandas as pd
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.figure import Figure
 import numpy as np
 import re
 from pathlib import Path
 
-def main():
+# Column index patterns, compiled once instead of per column and category
+FIRST_NUMBER_RE = re.compile(r'(\d+)')
+THREE_DIGIT_SUFFIX_RE = re.compile(r'(\d{3})$')
+
+def main(log=print):
+    """Create the histogram charts; log receives each progress line (the dashboard streams them)"""
     # Configuration
     MASTER_CSV = "csv_outputs/motor_data_master.csv"
     OUTPUT_DIR = "histogram_outputs"
@@ -20,20 +26,20 @@ def main():
     # Create output directory
     Path(OUTPUT_DIR).mkdir(exist_ok=True)
     
-    print("📊 Creating histograms from master CSV (summing all events)...")
+    log("📊 Creating histograms from master CSV (summing all events)...")
     
     # Check master CSV
     if not os.path.exists(MASTER_CSV):
-        print(f"❌ Master CSV not found: {MASTER_CSV}")
+        log(f"❌ Master CSV not found: {MASTER_CSV}")
         return False
     
     # Load data
     df = pd.read_csv(MASTER_CSV)
     if df.empty:
-        print("❌ Master CSV is empty")
+        log("❌ Master CSV is empty")
         return False
     
-    print(f"📅 Processing {len(df)} events from master CSV")
+    log(f"📅 Processing {len(df)} events from master CSV")
     
     # Define exact ranges - NO SMART EDITING
     categories = {
@@ -67,10 +73,11 @@ def main():
     
     # Process each category
     for category_name, config in categories.items():
-        print(f"\n🔍 Processing {category_name}...")
+        log(f"\n🔍 Processing {category_name}...")
         
         # Find matching columns and sum all values
         matching_data = {}
+        valid_indices = set(config['range'])
         for col in df.columns:
             if col == 'timestamp':
                 continue
@@ -78,23 +85,23 @@ def main():
             # Check if column matches pattern and extract index
             index = None
             if category_name == 'power' and 'power' in col.lower():
-                match = re.search(r'(\d+)', col)
+                match = FIRST_NUMBER_RE.search(col)
                 if match:
                     index = int(match.group(1))
             
             elif category_name == 'torque' and 'torque' in col.lower():
-                match = re.search(r'(\d+)', col)
+                match = FIRST_NUMBER_RE.search(col)
                 if match:
                     index = int(match.group(1))
             
             elif category_name == 'motor_temp' and ('motor' in col.lower() and 'temp' in col.lower()):
-                match = re.search(r'(\d+)', col)
+                match = FIRST_NUMBER_RE.search(col)
                 if match:
                     index = int(match.group(1))
             
             elif category_name == 'mosfet_temp' and ('mosfet' in col.lower() and 'temp' in col.lower()):
                 # Handle 3-digit MOSFET temp format like mosfetTemp040, mosfetTemp050, etc.
-                match = re.search(r'(\d{3})$', col)
+                match = THREE_DIGIT_SUFFIX_RE.search(col)
                 if match:
                     # Convert 3-digit format to actual temperature (040 -> 40, 050 -> 50, etc.)
                     temp_str = match.group(1)
@@ -104,7 +111,7 @@ def main():
                         index = int(temp_str.lstrip('0')) if temp_str.lstrip('0') else 0
             
             # If we found a valid index and it's in our range, sum all values
-            if index is not None and index in config['range']:
+            if index is not None and index in valid_indices:
                 # Sum all non-null values in this column across all rows
                 column_sum = df[col].fillna(0).sum()
                 if column_sum > 0:  # Only include if there's actual data
@@ -114,26 +121,27 @@ def main():
         full_range = config['range']
         full_values = [matching_data.get(idx, 0) for idx in full_range]
         
-        print(f"   ✅ Found data for {len(matching_data)} indices out of {len(full_range)} total")
+        log(f"   ✅ Found data for {len(matching_data)} indices out of {len(full_range)} total")
         total_sum = sum(matching_data.values())
-        print(f"   📊 Total sum across all events: {total_sum:.1f}")
+        log(f"   📊 Total sum across all events: {total_sum:.1f}")
         
         # Create chart
-        if create_simple_chart(full_range, full_values, category_name, config, OUTPUT_DIR, FIGURE_SIZE):
+        if create_simple_chart(full_range, full_values, category_name, config, OUTPUT_DIR, FIGURE_SIZE, log):
             charts_created += 1
-            print(f"   ✅ Created {category_name} chart")
+            log(f"   ✅ Created {category_name} chart")
         else:
-            print(f"   ❌ Failed to create {category_name} chart")
+            log(f"   ❌ Failed to create {category_name} chart")
     
-    print(f"\n🎉 Created {charts_created} charts")
+    log(f"\n🎉 Created {charts_created} charts")
     return charts_created > 0
 
-def create_simple_chart(indices, values, category_name, config, output_dir, figure_size):
+def create_simple_chart(indices, values, category_name, config, output_dir, figure_size, log=print):
     """Create a simple chart showing the complete range"""
     
     try:
-        # Create figure
-        fig, ax = plt.subplots(1, 1, figsize=figure_size)
+        # Create figure (pyplot-free, so it is safe to run inside the dashboard's threads)
+        fig = Figure(figsize=figure_size)
+        ax = fig.subplots(1, 1)
         
         # Create bars
         x_positions = range(len(indices))
@@ -143,7 +151,7 @@ def create_simple_chart(indices, values, category_name, config, output_dir, figu
         if max(values) > 0:
             norm_values = np.array(values)
             norm_values = norm_values / max(values)  # Normalize to 0-1
-            colors = plt.colormaps['viridis'](norm_values)
+            colors = matplotlib.colormaps['viridis'](norm_values)
             for bar, color in zip(bars, colors):
                 bar.set_facecolor(color)
         
@@ -184,11 +192,11 @@ def create_simple_chart(indices, values, category_name, config, output_dir, figu
                verticalalignment='top', horizontalalignment='right', fontsize=10)
         
         # Save files
-        plt.tight_layout()
+        fig.tight_layout()
         
         # PNG file
         png_file = os.path.join(output_dir, f'{category_name}_chart.png')
-        plt.savefig(png_file, dpi=300, bbox_inches='tight')
+        fig.savefig(png_file, dpi=300, bbox_inches='tight')
         
         # CSV file
         csv_file = os.path.join(output_dir, f'{category_name}_numeric_values.csv')
@@ -199,11 +207,10 @@ def create_simple_chart(indices, values, category_name, config, output_dir, figu
         })
         chart_df.to_csv(csv_file, index=False)
         
-        plt.close()
         return True
         
     except Exception as e:
-        print(f"   ❌ Error creating {category_name} chart: {e}")
+        log(f"   ❌ Error creating {category_name} chart: {e}")
         return False
 
 if __name__ == "__main__":
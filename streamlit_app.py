@@ -6,20 +6,19 @@ Interactive web interface for PostHog motor data visualization and analysis
 
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import glob
 import os
-import subprocess
+import shutil
 import sys
+import threading
+import time
+import queue
 from pathlib import Path
 import re
-from datetime import datetime, timedelta
 import pytz
 import hashlib
+import hmac
+import html
+from functools import partial
 
 # Configure page
 st.set_page_config(
@@ -29,36 +28,53 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
-<style>
-    .main > div {
-        padding-top: 2rem;
-    }
-    .stMetric {
-        background-color: #f0f2f6;
-        border: 1px solid #e0e0e0;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 0.5rem 0;
-    }
-    .css-1d391kg {
-        padding-top: 1rem;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Dashboard styling lives in a static file that is read once per server process
+@st.cache_resource(show_spinner=False)
+def load_dashboard_css():
+    """Read the dashboard stylesheet"""
+    return (Path(__file__).parent / "assets" / "dashboard.css").read_text()
+
+st.markdown(f"<style>{load_dashboard_css()}</style>", unsafe_allow_html=True)
+
+# Timezone used for all displayed timestamps (pytz builds a new tzinfo on every lookup)
+PACIFIC_TZ = pytz.timezone('US/Pacific')
+
+# PyArrow CSV parsing (optional - multi-threaded, falls back to pandas)
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa_csv = None
 
 # === AUTHENTICATION SYSTEM ===
 
 # Import authentication config from external file
 try:
-    from config import AUTH_USERS, POSTHOG_API_KEY, POSTHOG_PROJECT_ID
+    from config import AUTH_USERS, POSTHOG_API_KEY, POSTHOG_PROJECT_ID, ARGON2_SETTINGS
     USERS = AUTH_USERS
-    # This ensures environment variables are set for subprocess calls
+    # Importing config also sets the PostHog environment variables GetPostHog reads
 except ImportError:
     st.error("❌ Authentication configuration file not found. Please contact administrator.")
     st.stop()
 
+# Argon2 password hashing with the same settings as config.hash_new_password (legacy SHA-256 hashes are still accepted)
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import VerificationError, InvalidHashError
+    PASSWORD_HASHER = PasswordHasher(**ARGON2_SETTINGS)
+except ImportError:
+    PASSWORD_HASHER = None
+
+# Imported after config so the PostHog credentials are already in the environment
+from scripts.GetPostHog import run as run_posthog, run_for_timestamps, CATEGORIES as POSTHOG_CATEGORIES
+
+# Seconds before histogram generation is given up on so a hang can't block the session
+SCRIPT_TIMEOUT = 300
+
+# Property count range of complete Motor Data events (quality control for bulk downloads)
+QUALITY_MIN_PROPERTIES = 160
+QUALITY_MAX_PROPERTIES = 170
+
 def hash_password(password):
     """Hash a password using SHA-256"""
     return hashlib.sha256(password.encode()).hexdigest()
@@ -67,20 +83,40 @@ def check_authentication():
     """Check if user is authenticated"""
     return st.session_state.get('authenticated', False)
 
+def verify_password(stored_hash, password):
+    """Check a password against an Argon2 or legacy SHA-256 hash"""
+    if stored_hash.startswith("$argon2"):
+        if PASSWORD_HASHER is None:
+            return False
+        try:
+            return PASSWORD_HASHER.verify(stored_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    return hmac.compare_digest(stored_hash, hash_password(password))
+
+@st.cache_resource(show_spinner=False)
+def get_dummy_password_hash():
+    """Hash checked for unknown usernames, of the same kind as the configured ones (works with no users)"""
+    if PASSWORD_HASHER is not None and any(h.startswith("$argon2") for h in USERS.values()):
+        return PASSWORD_HASHER.hash("")
+    return hash_password("")
+
 def authenticate_user(username, password):
     """Authenticate user with username and password"""
-    if username in USERS and USERS[username] == hash_password(password):
+    stored_hash = USERS.get(username)
+    # Unknown usernames are still checked against a real hash so timing doesn't reveal valid users
+    password_ok = verify_password(stored_hash or get_dummy_password_hash(), password)
+    if stored_hash is not None and password_ok:
         st.session_state.authenticated = True
         st.session_state.username = username
         return True
     return False
 
 def logout():
-    """Logout user"""
+    """Logout user (used as a button callback, so the click's own rerun shows the login page)"""
     st.session_state.authenticated = False
     if 'username' in st.session_state:
         del st.session_state.username
-    st.rerun()
 
 def show_login_page():
     """Display the login page"""
@@ -133,40 +169,123 @@ def show_login_page():
         </div>
         """, unsafe_allow_html=True)
 
-def format_timestamp_readable(timestamp_str):
-    """Convert ISO timestamp to readable American format with Pacific Time"""
+def format_timestamps_readable(timestamps):
+    """Convert ISO timestamps to readable American format with Pacific Time in one vectorized pass"""
+    # Timestamps without timezone info are assumed to be UTC
+    parsed = pd.to_datetime(pd.Series(timestamps, dtype=object), utc=True, format='ISO8601', errors='coerce')
+    formatted = parsed.dt.tz_convert(PACIFIC_TZ).dt.strftime('%m/%d/%Y %I:%M:%S %p PT')
+    # If parsing fails, keep the original timestamp
+    return formatted.where(parsed.notna(), pd.Series(timestamps, dtype=object)).tolist()
+
+# Cells pandas.read_csv reads as missing by default (pyarrow's own list lacks 'None' and '<NA>')
+PANDAS_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+
+def read_csv_with_pyarrow(path):
+    """Read a CSV with pyarrow's multi-threaded parser into the frame pd.read_csv would return"""
+    convert_options = pa_csv.ConvertOptions(
+        column_types={'timestamp': pa.string()},
+        null_values=PANDAS_NA_VALUES,
+        strings_can_be_null=True,
+    )
+    table = pa_csv.read_csv(path, convert_options=convert_options)
+    # pandas keeps date/time-looking text as strings, so re-read any such column as text (only timestamp, normally)
+    temporal_columns = {field.name: pa.string() for field in table.schema if pa.types.is_temporal(field.type)}
+    if temporal_columns:
+        convert_options.column_types = {'timestamp': pa.string(), **temporal_columns}
+        table = pa_csv.read_csv(path, convert_options=convert_options)
+    # pandas reads an all-empty column as float64 NaN rather than object None
+    null_columns = [field.name for field in table.schema if pa.types.is_null(field.type)]
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    del table  # self_destruct leaves the table unusable
+    if null_columns:
+        df[null_columns] = df[null_columns].astype('float64')
+    return df
+
+def read_master_csv(path):
+    """Read a full master CSV into pandas, parsing with pyarrow when installed"""
+    if pa_csv is not None:
+        try:
+            return read_csv_with_pyarrow(path)
+        except pa.ArrowInvalid:
+            # Types are inferred per block, so a column that is empty at the top can fail later; pandas copes
+            pass
+    return pd.read_csv(path)
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def load_master_timestamps(fingerprint):
+    """Return the set of event timestamps already stored in the master CSV (cached per fingerprint)"""
+    if fingerprint is None:
+        return set()
     try:
-        # Parse the ISO timestamp
-        if timestamp_str.endswith('Z'):
-            dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-        elif '+00:00' in timestamp_str:
-            dt = datetime.fromisoformat(timestamp_str)
-        else:
-            # Try parsing without timezone info, assume UTC
-            dt = datetime.fromisoformat(timestamp_str.replace('Z', ''))
-            dt = dt.replace(tzinfo=pytz.UTC)
-        
-        # Convert to Pacific Time
-        pacific = pytz.timezone('US/Pacific')
-        pt_time = dt.astimezone(pacific)
-        
-        # Format as MM/DD/YYYY HH:MM:SS AM/PM PT
-        formatted = pt_time.strftime('%m/%d/%Y %I:%M:%S %p PT')
-        return formatted
-    except Exception as e:
-        # If parsing fails, return original timestamp
-        return timestamp_str
+        return set(pd.read_csv(fingerprint[0], usecols=['timestamp'])['timestamp'].astype(str))
+    except (ValueError, pd.errors.EmptyDataError):
+        return set()
 
-def load_available_data():
-    """Load available CSV data from master file"""
+def get_master_fingerprint():
+    """Return (path, mtime, size) of the master CSV, or None if it is missing"""
     master_csv_file = "csv_outputs/motor_data_master.csv"
-    
+    try:
+        stat = os.stat(master_csv_file)
+    except OSError:
+        return None
+    return (master_csv_file, stat.st_mtime, stat.st_size)
+
+def scan_files(dirname, suffix=""):
+    """Return (name, path, stat) for each file in dirname ending with suffix, in one scandir pass"""
+    try:
+        with os.scandir(dirname) as entries:
+            return [(entry.name, entry.path, entry.stat()) for entry in entries
+                    if entry.is_file() and entry.name.endswith(suffix)]
+    except FileNotFoundError:
+        return []
+
+# Directories holding downloaded data and generated charts
+OUTPUT_DIRS = ("csv_outputs", "histogram_outputs")
+
+def get_output_dirs_fingerprint():
+    """Return the output directory mtimes, which only change when files are added or removed"""
+    mtimes = []
+    for dirname in OUTPUT_DIRS:
+        try:
+            mtimes.append(os.stat(dirname).st_mtime_ns)
+        except FileNotFoundError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def count_output_files(fingerprint):
+    """Count the entries Clear Data removes from the output directories (cached on the directory mtimes)"""
+    total = 0
+    for dirname in OUTPUT_DIRS:
+        try:
+            with os.scandir(dirname) as entries:
+                total += sum(1 for _ in entries)
+        except FileNotFoundError:
+            pass
+    return total
+
+def get_histogram_fingerprint(entries=None):
+    """Return a sorted tuple of (path, mtime, size) for the histogram CSV files, reusing a scan_files result if given"""
+    if entries is None:
+        entries = scan_files("histogram_outputs")
+    return tuple(sorted(
+        (path, stat.st_mtime, stat.st_size)
+        for name, path, stat in entries if name.endswith("_numeric_values.csv")
+    ))
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def load_available_data(fingerprint):
+    """Load available CSV data from master file (cached on the master CSV fingerprint)"""
     # Check if master CSV exists and has content
-    if not os.path.exists(master_csv_file) or os.path.getsize(master_csv_file) < 100:
+    if fingerprint is None or fingerprint[2] < 100:
         return {}
+    master_csv_file = fingerprint[0]
     
     try:
-        df = pd.read_csv(master_csv_file)
+        df = read_master_csv(master_csv_file)
         if df.empty:
             return {}
         
@@ -204,32 +323,67 @@ def load_available_data():
         st.warning(f"Could not load master CSV: {e}")
         return {}
 
-def load_histogram_data():
-    """Load histogram data files"""
-    data = {}
+@st.cache_data(show_spinner=False, max_entries=2)
+def get_overview_summary(fingerprint):
+    """Total property count and first stored timestamp for the Overview tab (cached per fingerprint)"""
+    csv_data = load_available_data(fingerprint)
+    total_properties = sum(len(df.columns) - 1 for df in csv_data.values())  # -1 for timestamp
+    # Stop at the first category that has a timestamp
+    latest_timestamp = next(
+        (df['timestamp'].iat[0] for df in csv_data.values() if 'timestamp' in df.columns and not df.empty),
+        None
+    )
+    return {'total_properties': total_properties, 'latest_timestamp': latest_timestamp}
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def build_categories_table(fingerprint):
+    """Build the Overview categories table once per master CSV fingerprint"""
+    csv_data = load_available_data(fingerprint)
+    # The fingerprint already carries the master CSV size, so no extra stat call is needed
+    size_str = f"{fingerprint[2] / 1024:.1f} KB" if fingerprint else "N/A"
     
-    # Try multiple patterns to find histogram CSV files
-    patterns = [
-        "histogram_outputs/*_numeric_values.csv",
-        "./histogram_outputs/*_numeric_values.csv",
-        os.path.join(os.getcwd(), "histogram_outputs", "*_numeric_values.csv")
-    ]
+    # Fill the columns in one pass and build the frame column-wise
+    names, props_ct, rows_ct = [], [], []
+    for category, df in csv_data.items():
+        names.append(category.replace("_", " ").title())
+        props_ct.append(len(df.columns) - 1)  # -1 for timestamp
+        rows_ct.append(len(df))
     
-    csv_files = []
-    for pattern in patterns:
-        files = glob.glob(pattern)
-        if files:
-            csv_files = files
-            break
+    return pd.DataFrame({
+        "Category": names,
+        "Properties": props_ct,
+        "Rows": rows_ct,
+        "Master CSV Size": size_str
+    })
+
+@st.cache_data(show_spinner=False, max_entries=12)
+def get_category_csv_bytes(fingerprint, category):
+    """Serialize one category for the download button (cached per master CSV fingerprint)"""
+    return load_available_data(fingerprint)[category].to_csv(index=False).encode()
+
+# Columns read from the *_numeric_values.csv files and their dtypes
+HISTOGRAM_COLUMNS = ['Numeric_Label', 'Value', 'Original_Property']
+HISTOGRAM_DTYPES = {'Numeric_Label': 'int32', 'Value': 'float32', 'Original_Property': 'category'}
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def load_histogram_file(file_path, mtime, size):
+    """Read one histogram CSV (cached per file, so unchanged files aren't parsed again)"""
+    # Only the columns the charts use, with compact dtypes
+    return pd.read_csv(file_path, usecols=HISTOGRAM_COLUMNS, dtype=HISTOGRAM_DTYPES)
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def load_histogram_data(fingerprint):
+    """Load histogram data files (cached on the histogram files fingerprint)"""
+    data = {}
     
     # Only load if files exist and have content
-    for file_path in csv_files:
+    for file_path, mtime, size in fingerprint:
         try:
             # Check file size 
-            if os.path.getsize(file_path) < 50:
+            if size < 50:
                 continue
                 
-            df = pd.read_csv(file_path)
+            df = load_histogram_file(file_path, mtime, size)
             if len(df) == 0:
                 continue
                 
@@ -243,18 +397,44 @@ def load_histogram_data():
     
     return data
 
+@st.cache_data(show_spinner=False, max_entries=2)
+def compute_histogram_stats(fingerprint):
+    """Summary statistics for each histogram category (cached on the histogram files fingerprint)"""
+    stats = {}
+    for category, df in load_histogram_data(fingerprint).items():
+        # One aggregation pass instead of separate min/max/mean/idxmin/idxmax calls
+        agg = df['Value'].agg(['min', 'max', 'mean', 'idxmin', 'idxmax'])
+        stats[category] = {
+            'min': agg['min'],
+            'max': agg['max'],
+            'mean': agg['mean'],
+            'count': len(df),
+            'min_label': df.at[agg['idxmin'], 'Numeric_Label'],
+            'max_label': df.at[agg['idxmax'], 'Numeric_Label'],
+        }
+    return stats
+
 def create_interactive_histogram(df, category):
     """Create an interactive Plotly histogram"""
+    # Imported on first use so plotly stays out of the dashboard's cold start (figures are cached)
+    import plotly.graph_objects as go
     fig = go.Figure()
     
+    # Build the hover labels once here so the browser doesn't evaluate a template per bar
+    hover_text = (
+        '<b>Index:</b> ' + df['Numeric_Label'].astype(str)
+        + '<br><b>Value:</b> ' + df['Value'].astype(str)
+        + '<br><b>Property:</b> ' + df['Original_Property'].astype(str)
+    ).to_numpy()
+    
     # Create bar chart
     fig.add_trace(go.Bar(
         x=df['Numeric_Label'],
         y=df['Value'],
         text=df['Value'],
         textposition='auto',
-        hovertemplate='<b>Index:</b> %{x}<br><b>Value:</b> %{y}<br><b>Property:</b> %{customdata}<extra></extra>',
-        customdata=df['Original_Property'],
+        hovertext=hover_text,
+        hoverinfo='text',
         marker=dict(
             color=df['Value'],
             colorscale='viridis',
@@ -273,6 +453,21 @@ def create_interactive_histogram(df, category):
     
     return fig
 
+@st.cache_resource(show_spinner=False, max_entries=8)
+def get_histogram_figure(_df, category, sig):
+    """Return a cached Plotly histogram; sig is the (mtime, size) of the category's data file"""
+    return create_interactive_histogram(_df, category)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def load_image_bytes(path, mtime):
+    """Read an image file once per modification time"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+# Numeric suffixes of master CSV columns (torque uses two digits, the rest three)
+_TWO_DIGIT_SUFFIX_RE = re.compile(r'(\d{2})$')
+_THREE_DIGIT_SUFFIX_RE = re.compile(r'(\d{3})$')
+
 def generate_charts_from_master_csv():
     """Generate charts directly from master CSV as backup method"""
     try:
@@ -280,7 +475,7 @@ def generate_charts_from_master_csv():
         if not os.path.exists(master_csv):
             return False, "Master CSV not found"
         
-        df = pd.read_csv(master_csv)
+        df = read_master_csv(master_csv)
         if df.empty:
             return False, "Master CSV is empty"
         
@@ -310,19 +505,18 @@ def generate_charts_from_master_csv():
                 continue
                 
             # Extract numeric data
-            import re
             property_data = []
             for col in category_cols:
                 try:
                     value = float(latest_row[col])
                     if not pd.isna(value):
                         if 'torque' in col.lower():
-                            match = re.search(r'(\d{2})$', col)
+                            match = _TWO_DIGIT_SUFFIX_RE.search(col)
                             if match:
                                 numeric_label = int(match.group(1))
                                 property_data.append((numeric_label, value, col))
                         else:
-                            match = re.search(r'(\d{3})$', col) 
+                            match = _THREE_DIGIT_SUFFIX_RE.search(col)
                             if match:
                                 numeric_label = int(match.group(1))
                                 property_data.append((numeric_label, value, col))
@@ -344,76 +538,15 @@ def generate_charts_from_master_csv():
     except Exception as e:
         return False, f"Error generating charts from master CSV: {str(e)}"
 
-def parse_events_from_output(output):
-    """Parse events from GetPostHog.py output"""
-    events = []
-    lines = output.split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        # Look for numbered event lines like "1. 2025-06-25T21:02:12.715Z (Session: xxxxx, 46 properties)"
-        if line and (line[0].isdigit() and '. ' in line):
-            try:
-                # Split on the first '. ' to separate number from rest
-                parts = line.split('. ', 1)
-                if len(parts) >= 2:
-                    event_text = parts[1]
-                    
-                    # Extract timestamp (ISO format)
-                    import re
-                    timestamp_match = re.search(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d{3})?Z?', event_text)
-                    
-                    # Extract session ID from (Session: xxxxx, properties)
-                    session_match = re.search(r'Session:\s*([^,)]+)', event_text)
-                    session_id = session_match.group(1).strip() if session_match else "Unknown"
-                    
-                    # Extract property count from ", XX properties)"
-                    properties_match = re.search(r'(\d+)\s+properties', event_text)
-                    properties_count = int(properties_match.group(1)) if properties_match else 0
-                    
-                    if timestamp_match:
-                        timestamp = timestamp_match.group()
-                        events.append({
-                            'timestamp': timestamp,
-                            'session_id': session_id,
-                            'properties_count': properties_count,
-                            'line': line
-                        })
-            except Exception:
-                continue
-        # Alternative format: lines with timestamp patterns directly
-        elif 'T' in line and ('Z' in line or '+' in line):
-            import re
-            timestamp_match = re.search(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d{3})?(?:Z|[+-]\d{2}:\d{2})', line)
-            if timestamp_match:
-                timestamp = timestamp_match.group()
-                events.append({
-                    'timestamp': timestamp,
-                    'session_id': "Unknown",
-                    'properties_count': 0,
-                    'line': line
-                })
-    
-    return events
-
-def fetch_motor_data(person_id, session_id=None):
-    """Fetch motor data from PostHog for the given person ID"""
-    try:
-        # Use sys.executable to ensure same Python environment
-        cmd = [sys.executable, "-W", "ignore", "scripts/GetPostHog.py", "-p", person_id]
-        
-        if session_id and session_id.strip():
-            cmd.extend(["-s", session_id.strip()])
-        
-        # Run the command
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=".")
-        
-        if result.returncode == 0:
-            return True, "Data fetched successfully!"
-        else:
-            return False, f"Error: {result.stderr}"
-    except Exception as e:
-        return False, f"Failed to fetch data: {str(e)}"
+@st.cache_data(ttl=60, show_spinner=False)
+def list_posthog_events(person_id, min_properties=0, max_properties=None):
+    """Event summaries for the person from GetPostHog (cached for a minute; failures are not cached)"""
+    success, result = run_posthog(
+        person_id, list_only=True, min_properties=min_properties, max_properties=max_properties
+    )
+    if not success:
+        raise RuntimeError(result)
+    return result
 
 def fetch_events_list(person_id):
     """Fetch list of available events for the person"""
@@ -422,25 +555,45 @@ def fetch_events_list(person_id):
         os.makedirs("csv_outputs", exist_ok=True)
         os.makedirs("histogram_outputs", exist_ok=True)
         
-        # Use sys.executable to ensure same Python environment  
-        cmd = [sys.executable, "-W", "ignore", "scripts/GetPostHog.py", "-p", person_id, "-s", "", "-l"]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=".")
-        
-        if result.returncode == 0:
-            # Parse the output to extract events
-            events = parse_events_from_output(result.stdout)
-            
-            return True, events
-        else:
-            st.error(f"Failed to fetch events (exit code {result.returncode})")
-            if result.stderr:
-                st.error(f"Error details: {result.stderr}")
-            return False, []
+        return True, list_posthog_events(person_id)
     except Exception as e:
         st.error(f"Failed to fetch events: {str(e)}")
         return False, []
 
+def build_event_row(timestamp, categorized):
+    """Combine the first row of every category into a single master CSV row"""
+    event_data = {"timestamp": timestamp}
+    for category in POSTHOG_CATEGORIES:
+        rows = categorized.get(category)
+        if rows:
+            # Add all properties from this category to the event data
+            row_data = rows[0]
+            for key in sorted(row_data):
+                value = row_data[key]
+                if key != 'timestamp' and value is not None and value != "":
+                    event_data[key] = value
+    return event_data
+
+def append_rows_to_master(new_rows):
+    """Append event rows to the master CSV, rewriting the file only when new columns appear"""
+    master_csv_file = "csv_outputs/motor_data_master.csv"
+    new_df = pd.DataFrame(new_rows)
+    
+    if not os.path.exists(master_csv_file) or os.path.getsize(master_csv_file) == 0:
+        new_df.to_csv(master_csv_file, index=False)
+        return
+    
+    existing_columns = pd.read_csv(master_csv_file, nrows=0).columns
+    if set(new_df.columns).issubset(existing_columns):
+        # Only the new rows are written; the existing rows are never re-read
+        new_df.reindex(columns=existing_columns).to_csv(master_csv_file, mode='a', header=False, index=False)
+    else:
+        # New columns need a new header, so combine and remove duplicates
+        existing_df = read_master_csv(master_csv_file)
+        combined_df = pd.concat([existing_df, new_df], ignore_index=True, sort=False)
+        combined_df = combined_df.drop_duplicates(subset=['timestamp'], keep='last')
+        combined_df.to_csv(master_csv_file, index=False)
+
 def fetch_specific_event_data(person_id, timestamp):
     """Fetch data for a specific event timestamp and append to master CSV"""
     try:
@@ -450,50 +603,27 @@ def fetch_specific_event_data(person_id, timestamp):
         os.makedirs("csv_outputs", exist_ok=True)
         os.makedirs("histogram_outputs", exist_ok=True)
         
-        # Use sys.executable to ensure same Python environment
-        cmd = [sys.executable, "-W", "ignore", "scripts/GetPostHog.py", "-p", person_id, "-t", timestamp, "-s", ""]
+        # Nothing to download if the event is already in the master CSV
+        if timestamp in load_master_timestamps(get_master_fingerprint()):
+            st.info("ℹ️ Event already in master CSV")
+            return True, "Event already in master CSV"
         
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=".", timeout=60)
+        # Call GetPostHog in-process and combine the categories into one row for master CSV
+        success, result = run_posthog(person_id, timestamp=timestamp)
         
-        if result.returncode == 0:
-            # Read the generated CSV files and combine into one row for master CSV
+        if success:
             master_csv_file = "csv_outputs/motor_data_master.csv"
-            event_data = {"timestamp": timestamp}
-            
-            # Read all category files and combine properties
-            for category in ['power', 'torque', 'motor_temp', 'mosfet_temp', 'mosfet_cooldown', 'motor_cooldown']:
-                csv_file = f"csv_outputs/posthog_event_{category}.csv"
-                if os.path.exists(csv_file):
-                    try:
-                        df = pd.read_csv(csv_file)
-                        if not df.empty and len(df) > 0:
-                            # Add all properties from this category to the event data
-                            row_data = df.iloc[0].to_dict()
-                            for key, value in row_data.items():
-                                if key != 'timestamp' and pd.notna(value):
-                                    event_data[key] = value
-                        # Clean up the category file
-                        os.remove(csv_file)
-                    except Exception as e:
-                        st.warning(f"Warning: Could not read {csv_file}: {str(e)}")
+            event_data = build_event_row(timestamp, result)
             
             # Append to master CSV
             if len(event_data) > 1:  # More than just timestamp
-                new_df = pd.DataFrame([event_data])
-                
-                if os.path.exists(master_csv_file):
-                    try:
-                        existing_df = pd.read_csv(master_csv_file)
-                        # Combine and remove duplicates
-                        combined_df = pd.concat([existing_df, new_df], ignore_index=True, sort=False)
-                        combined_df = combined_df.drop_duplicates(subset=['timestamp'], keep='last')
-                        combined_df.to_csv(master_csv_file, index=False)
-                    except Exception as e:
-                        st.warning(f"Error updating master CSV, creating new one: {str(e)}")
-                        new_df.to_csv(master_csv_file, index=False)
-                else:
-                    new_df.to_csv(master_csv_file, index=False)
+                try:
+                    append_rows_to_master([event_data])
+                except Exception as e:
+                    st.warning(f"Error updating master CSV, creating new one: {str(e)}")
+                    pd.DataFrame([event_data]).to_csv(master_csv_file, index=False)
                 
+                load_available_data.clear()
                 st.success("✅ Event data downloaded and added to master dataset!")
                 return True, "Event data fetched successfully!"
             else:
@@ -501,69 +631,19 @@ def fetch_specific_event_data(person_id, timestamp):
                 return False, "No data found"
         else:
             st.error(f"❌ Failed to download event data")
-            if result.stderr:
-                st.error(f"Error details: {result.stderr}")
-            return False, f"Error: {result.stderr or 'Unknown error'}"
-    except subprocess.TimeoutExpired:
-        st.error("⏰ Download timed out after 60 seconds")
-        return False, "Download timed out"
+            st.error(f"Error details: {result}")
+            return False, f"Error: {result}"
     except Exception as e:
         st.error(f"❌ Failed to fetch event data: {str(e)}")
         return False, f"Failed to fetch event data: {str(e)}"
 
-def run_data_collection(person_id, session_id=None, timestamp=None):
-    """Run the data collection script"""
-    # Use sys.executable to ensure same Python environment
-    cmd = [sys.executable, "-W", "ignore", "scripts/GetPostHog.py", "-p", person_id]
-    
-    if session_id:
-        cmd.extend(["-s", session_id])
-    if timestamp:
-        cmd.extend(["-t", timestamp])
-    
-    try:
-        with st.spinner("Downloading data from PostHog..."):
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        st.success("✅ Data downloaded successfully!")
-        return True, result.stdout
-    except subprocess.CalledProcessError as e:
-        # Check if it's a timestamp not found issue
-        if "No event found with timestamp matching" in str(e.stdout):
-            st.warning("⚠️ Timestamp not found in available data.")
-            
-            # Extract available timestamps from output
-            if "Available timestamps:" in str(e.stdout):
-                lines = str(e.stdout).split('\n')
-                timestamps = []
-                capture_timestamps = False
-                for line in lines:
-                    if "Available timestamps:" in line:
-                        capture_timestamps = True
-                        continue
-                    if capture_timestamps and line.strip().startswith('- '):
-                        timestamp = line.strip()[2:]  # Remove '- ' prefix
-                        timestamps.append(timestamp)
-                
-                if timestamps:
-                    st.info("💡 Try using one of these available timestamps instead:")
-                    for ts in timestamps[:5]:  # Show first 5
-                        st.code(ts)
-                    
-                    st.info("🔧 Or clear the timestamp field to fetch the most recent data.")
-            
-            return False, "Timestamp not found"
-        
-        # Check if it's just a warning issue
-        elif "NotOpenSSLWarning" in str(e.stderr) or "urllib3" in str(e.stderr):
-            st.warning("⚠️ This appears to be just an SSL warning. The script may have run successfully.")
-            st.info("💡 Check the CSV outputs folder to see if data was downloaded.")
-            return True, e.stderr
-        else:
-            st.error(f"❌ Error downloading data:")
-            return False, e.stderr
+@st.cache_resource
+def get_histogram_generation_lock():
+    """Held while a histogram worker is running, shared by every session and rerun in this process"""
+    return threading.Lock()
 
 def run_histogram_generation():
-    """Run the histogram generation script"""
+    """Run the histogram generation script; success is None while an earlier run is still writing outputs"""
     try:
         # Ensure output directories exist
         os.makedirs("csv_outputs", exist_ok=True)
@@ -576,249 +656,278 @@ def run_histogram_generation():
             return False, "Master CSV not found"
         
         with st.spinner("Generating histograms..."):
-            # Use sys.executable to ensure same Python environment
-            result = subprocess.run(
-                [sys.executable, "-W", "ignore", "scripts/create_histograms.py"], 
-                capture_output=True, text=True, check=True
-            )
+            st.text("Script output:")
+            output_box = st.empty()
+            output_lines = []
+            
+            # Imported on first use so matplotlib stays out of the dashboard's cold start
+            from scripts.create_histograms import main as create_histograms
             
-            # Show debug output
-            if result.stdout:
-                st.text("Script output:")
-                st.code(result.stdout, language="text")
+            # Run in a worker so a slow or hung run can't block the session past SCRIPT_TIMEOUT;
+            # the worker only queues output lines and this thread draws them
+            lines = queue.Queue()
+            outcome = {}
+            
+            def worker():
+                try:
+                    outcome['created'] = create_histograms(log=lambda message="": lines.put(f"{message}\n"))
+                except Exception as e:
+                    outcome['error'] = e
+                finally:
+                    generation_lock.release()
+                    lines.put(None)
+            
+            # One worker writes histogram_outputs/ at a time; a timed-out worker holds the lock until it really ends
+            generation_lock = get_histogram_generation_lock()
+            if not generation_lock.acquire(blocking=False):
+                st.warning("⏳ Histogram generation is already running. Try again once it finishes.")
+                return None, "Histogram generation already running"
+            try:
+                threading.Thread(target=worker, daemon=True).start()
+            except BaseException:
+                generation_lock.release()
+                raise
+            deadline = time.monotonic() + SCRIPT_TIMEOUT
+            while True:
+                try:
+                    line = lines.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    # A thread can't be killed; a hung run is left behind, still holding the lock, and its output discarded
+                    st.error(f"❌ Histogram generation timed out after {SCRIPT_TIMEOUT} seconds")
+                    return None, "".join(output_lines)
+                if line is None:
+                    break
+                # Show the script output while it runs instead of buffering it until the end
+                output_lines.append(line)
+                output_box.code("".join(output_lines), language="text")
+            
+            output = "".join(output_lines)
+            if 'error' in outcome:
+                raise outcome['error']
+            if not outcome['created']:
+                # The streamed output above already includes the error details
+                st.error("❌ Error generating histograms")
+                return False, output
             
             # Check if files were actually created
-            hist_files = glob.glob("histogram_outputs/*.png")
-            csv_files = glob.glob("histogram_outputs/*.csv")
+            output_names = [name for name, _, _ in scan_files("histogram_outputs")]
+            hist_files = [name for name in output_names if name.endswith(".png")]
+            csv_files = [name for name in output_names if name.endswith(".csv")]
             
             if hist_files or csv_files:
                 st.success(f"✅ Generated {len(hist_files)} images and {len(csv_files)} data files!")
             else:
                 st.warning("⚠️ Script completed but no output files found.")
                 
-        return True, result.stdout
+        return True, output
         
-    except subprocess.CalledProcessError as e:
-        st.error(f"❌ Error generating histograms (exit code {e.returncode}):")
-        if e.stdout:
-            st.text("Script output:")
-            st.code(e.stdout, language="text")
-        if e.stderr:
-            st.text("Error details:")
-            st.code(e.stderr, language="text")
-        return False, e.stderr
     except Exception as e:
         st.error(f"❌ Unexpected error: {str(e)}")
         return False, str(e)
 
-def fetch_bulk_events(person_id, event_count=None):
-    """Fetch multiple events and combine them into a single dataset (only events with 160+ properties)"""
+def iter_event_downloads(person_id, selected_events):
+    """Fetch the person's events once, then yield (index, success, result) for each selected event"""
+    # One listing request for the whole batch instead of one full listing per event
+    try:
+        success, result = run_for_timestamps(person_id, [event['timestamp'] for event in selected_events])
+    except Exception as e:
+        success, result = False, str(e)
+    
+    for i, event in enumerate(selected_events):
+        if not success:
+            yield i, False, result
+        elif result.get(event['timestamp']) is None:
+            yield i, False, f"No event found with timestamp matching: {event['timestamp']}"
+        else:
+            yield i, True, result[event['timestamp']]
+
+@st.cache_resource
+def get_bulk_download_registry():
+    """Lock and in-flight bulk downloads, shared by every session and rerun in this process"""
+    return threading.Lock(), {}
+
+def fetch_bulk_events(person_id, event_count=None, events=None):
+    """Fetch multiple events, joining an identical download that is already running instead of starting another"""
+    lock, inflight = get_bulk_download_registry()
+    key = (person_id, event_count, tuple(event['timestamp'] for event in events) if events is not None else None)
+    
+    with lock:
+        running = inflight.get(key)
+        is_owner = running is None
+        if is_owner:
+            running = inflight[key] = {'done': threading.Event(), 'result': (False, "Bulk download was interrupted")}
+    
+    if not is_owner:
+        # A double click or another tab already started this download; wait for its result
+        running['done'].wait()
+        return running['result']
+    
+    try:
+        running['result'] = run_bulk_download(person_id, event_count, events)
+        return running['result']
+    finally:
+        with lock:
+            inflight.pop(key, None)
+        running['done'].set()
+
+def run_bulk_download(person_id, event_count=None, events=None):
+    """Fetch multiple events and combine them into a single dataset (only events with 160+ properties unless events are given)"""
     try:
         import pandas as pd
-        import requests
         import os
         
         # Ensure output directories exist
         os.makedirs("csv_outputs", exist_ok=True)
         os.makedirs("histogram_outputs", exist_ok=True)
         
-        # First get the list of events
-        cmd = [sys.executable, "-W", "ignore", "scripts/GetPostHog.py", "-p", person_id, "-s", "", "-l"]
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=".", timeout=120)
-        
-        if result.returncode != 0:
-            return False, f"Failed to fetch event list: {result.stderr or 'Unknown error'}"
-        
-        # Parse events 
-        events = parse_events_from_output(result.stdout)
-        if not events:
-            return False, "No events found"
-        
-        # Filter events to only include those with 160-170 properties (quality control)
-        quality_events = [event for event in events if 160 <= event['properties_count'] <= 170]
-        
-        if not quality_events:
-            return False, f"No high-quality events found (need 160-170 properties). Found {len(events)} events but none were in the optimal range."
-        
-        if event_count:
-            # Take only the requested number of recent quality events
-            selected_events = quality_events[:event_count]
-            action_text = f"last {event_count} quality"
-            # Show filtering info specific to the requested count
-            st.info(f"🔍 Quality filter: Selected {len(selected_events)} quality events from {len(quality_events)} available events with 160-170 properties")
+        if events is not None:
+            # Events picked explicitly (e.g. the current browser page) skip the listing and quality filter
+            selected_events = list(events)
+            action_text = f"{len(selected_events)} selected"
         else:
-            # Take all quality events
-            selected_events = quality_events
-            action_text = f"all {len(quality_events)} quality"
-            # Show filtering info for all events
-            if len(quality_events) < len(events):
-                st.info(f"🔍 Quality filter: Using {len(quality_events)} events with 160-170 properties (filtered out {len(events) - len(quality_events)} events outside optimal range)")
-        
-        # Initialize combined data structures with timestamps
-        all_events_data = []
-        
-        # Download each event and collect data immediately
+            # First get the list of events, keeping only those with 160-170 properties (quality control)
+            try:
+                quality_events = list_posthog_events(
+                    person_id, min_properties=QUALITY_MIN_PROPERTIES, max_properties=QUALITY_MAX_PROPERTIES
+                )
+            except Exception as e:
+                return False, f"Failed to fetch event list: {str(e)}"
+            
+            if not quality_events:
+                return False, "No high-quality events found (need 160-170 properties)."
+            
+            if event_count:
+                # Take only the requested number of recent quality events
+                selected_events = quality_events[:event_count]
+                action_text = f"last {event_count} quality"
+                # Show filtering info specific to the requested count
+                st.info(f"🔍 Quality filter: Selected {len(selected_events)} quality events from {len(quality_events)} available events with 160-170 properties")
+            else:
+                # Take all quality events
+                selected_events = quality_events
+                action_text = f"all {len(quality_events)} quality"
+                # Show filtering info for all events
+                st.info(f"🔍 Quality filter: Using {len(quality_events)} events with 160-170 properties")
+        
+        # Skip events already in the master CSV before doing any download work
+        existing_timestamps = load_master_timestamps(get_master_fingerprint())
+        if existing_timestamps:
+            selected_events = [event for event in selected_events if event['timestamp'] not in existing_timestamps]
+            if not selected_events:
+                st.info("ℹ️ All selected events already in master CSV")
+                return True, "All selected events already in master CSV"
+        
+        # Download the selected events from a single PostHog listing
+        rows_by_index = {}
         success_count = 0
         progress_bar = st.progress(0)
         status_text = st.empty()
         
-        for i, event in enumerate(selected_events):
-            progress = (i + 1) / len(selected_events)
-            progress_bar.progress(progress)
-            status_text.text(f"Downloading event {i+1}/{len(selected_events)}: {event['timestamp'][:16]} ({event['properties_count']} properties)...")
-            
-            # Download individual event using the working GetPostHog.py script
-            event_cmd = [sys.executable, "-W", "ignore", "scripts/GetPostHog.py", "-p", person_id, "-t", event['timestamp'], "-s", ""]
-            event_result = subprocess.run(event_cmd, capture_output=True, text=True, cwd=".", timeout=60)
+        downloads = iter_event_downloads(person_id, selected_events)
+        for done_count, (i, event_success, event_result) in enumerate(downloads, 1):
+            event = selected_events[i]
+            progress_bar.progress(done_count / len(selected_events))
+            status_text.text(f"Downloaded {done_count}/{len(selected_events)}: {event['timestamp'][:16]} ({event['properties_count']} properties)...")
             
-            if event_result.returncode == 0:
-                # Immediately read and backup the generated CSV files before the next download overwrites them
-                event_data = {'timestamp': event['timestamp'], 'properties': {}}
+            if event_success:
+                row = build_event_row(event['timestamp'], event_result)
                 
-                for category in ['power', 'torque', 'motor_temp', 'mosfet_temp', 'mosfet_cooldown', 'motor_cooldown']:
-                    csv_file = f"csv_outputs/posthog_event_{category}.csv"
-                    if os.path.exists(csv_file):
-                        try:
-                            df = pd.read_csv(csv_file)
-                            if not df.empty and len(df) > 0:
-                                # Convert the row data back to properties format
-                                row_data = df.iloc[0].to_dict()
-                                for key, value in row_data.items():
-                                    if key != 'timestamp' and pd.notna(value):
-                                        event_data['properties'][key] = value
-                        except Exception as e:
-                            st.warning(f"Warning: Could not read {csv_file} for event {i+1}: {str(e)}")
-                
-                if event_data['properties']:
-                    all_events_data.append(event_data)
+                if len(row) > 1:  # More than just timestamp
+                    rows_by_index[i] = row
                     success_count += 1
                 else:
                     st.warning(f"No data found for event {i+1}")
             else:
-                st.warning(f"Failed to download event {i+1}: {event_result.stderr}")
-                continue
+                st.warning(f"Failed to download event {i+1}: {event_result}")
+        
+        # One master CSV row per downloaded event, in the original (newest first) order
+        new_rows = [rows_by_index[i] for i in sorted(rows_by_index)]
         
         # Clear progress indicators
         progress_bar.empty()
         status_text.empty()
         
         if success_count > 0:
-            # Process and append all event data to master CSV
+            # Append all event rows to master CSV
             status_text.text("Processing and appending data to master CSV...")
             
             master_csv_file = "csv_outputs/motor_data_master.csv"
-            new_rows = []
-            
-            # Process each event's properties into a single row
-            for event_info in all_events_data:
-                timestamp = event_info['timestamp']
-                properties = event_info['properties']
-                
-                # Create a single row with timestamp and all properties
-                row = {"timestamp": timestamp}
-                row.update(properties)  # Add all properties to the row
-                new_rows.append(row)
             
             if new_rows:
-                new_df = pd.DataFrame(new_rows)
-                
                 # Check if master CSV exists and append, otherwise create new
                 if os.path.exists(master_csv_file):
                     try:
-                        existing_df = pd.read_csv(master_csv_file)
-                        # Combine existing and new data
-                        combined_df = pd.concat([existing_df, new_df], ignore_index=True, sort=False)
-                        # Remove duplicates based on timestamp
-                        combined_df = combined_df.drop_duplicates(subset=['timestamp'], keep='last')
-                        combined_df.to_csv(master_csv_file, index=False)
-                        st.info(f"📊 Appended {len(new_rows)} new events to master CSV (total: {len(combined_df)} events)")
+                        append_rows_to_master(new_rows)
+                        st.info(f"📊 Appended {len(new_rows)} new events to master CSV (total: {len(existing_timestamps) + len(new_rows)} events)")
                     except Exception as e:
                         st.warning(f"Error reading existing CSV, creating new one: {str(e)}")
-                        new_df.to_csv(master_csv_file, index=False)
+                        pd.DataFrame(new_rows).to_csv(master_csv_file, index=False)
                         st.info(f"📊 Created new master CSV with {len(new_rows)} events")
                 else:
                     # Create new master CSV
-                    new_df.to_csv(master_csv_file, index=False)
+                    pd.DataFrame(new_rows).to_csv(master_csv_file, index=False)
                     st.info(f"📊 Created new master CSV with {len(new_rows)} events")
                 
-                # Clean up old category-specific CSV files
-                for category in ['power', 'torque', 'motor_temp', 'mosfet_temp', 'mosfet_cooldown', 'motor_cooldown']:
-                    old_csv = f"csv_outputs/posthog_event_{category}.csv"
-                    if os.path.exists(old_csv):
-                        try:
-                            os.remove(old_csv)
-                        except:
-                            pass  # Ignore errors when cleaning up
+                load_available_data.clear()
                 
                 # Show total properties info
                 total_properties = sum(len(row) - 1 for row in new_rows)  # -1 for timestamp
                 st.info(f"📈 Added {total_properties} total properties from {success_count} events to master dataset")
             
             status_text.empty()
-            st.success(f"✅ Successfully added {success_count}/{len(selected_events)} quality events to master CSV!")
+            st.success(f"✅ Successfully added {success_count}/{len(selected_events)} events to master CSV!")
             return True, f"Downloaded and added {action_text} events successfully ({success_count}/{len(selected_events)} succeeded)"
         else:
             return False, "Failed to download any events"
     
-    except subprocess.TimeoutExpired:
-        return False, "Bulk download timed out (operation exceeded 2 minutes)"
     except Exception as e:
         return False, f"Failed to fetch bulk events: {str(e)}"
 
+def open_event_browser():
+    """Show the event browser for the Person ID currently in the sidebar (button callback)"""
+    # Read the widget's live value; a bound argument would be the ID from the previous render
+    st.session_state.person_id = st.session_state.person_id_input
+    st.session_state.show_event_browser = True
+    st.session_state.pop('event_listing', None)
+
+def close_event_browser():
+    """Return to the dashboard and reset pagination (button callback)"""
+    st.session_state.show_event_browser = False
+    st.session_state.pop('event_page', None)
+
+def refresh_event_list():
+    """Drop the kept and cached event listings and go back to the first page (button callback)"""
+    list_posthog_events.clear()
+    st.session_state.pop('event_listing', None)
+    st.session_state.event_page = 0
+
+def set_event_page(page):
+    """Move the event browser to page (button callback, applied before the rerun)"""
+    st.session_state.event_page = page
+
+def select_event_row(table_key, page_events):
+    """Queue the clicked event for download and reset the table selection (dataframe on_select callback)"""
+    rows = st.session_state[table_key]["selection"]["rows"]
+    if rows:
+        st.session_state.pending_event_download = page_events[rows[0]]
+    # A fresh table key drops the selection, so each click triggers exactly one download
+    st.session_state.events_table_version = st.session_state.get('events_table_version', 0) + 1
+
 def main():
     # Check authentication first
     if not check_authentication():
         show_login_page()
         return
-    
-    # Add adaptive theme CSS that works in both light and dark modes
-    st.markdown("""
-    <style>
-    /* Improve readability and accessibility */
-    .stButton button {
-        border: 1px solid #e0e0e0;
-    }
-    
-    /* Ensure good contrast for metrics */
-    .stMetric {
-        background-color: var(--background-color);
-        border: 1px solid var(--border-color);
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 0.5rem 0;
-    }
-    
-    /* Ensure tables are readable */
-    .stDataFrame {
-        border: 1px solid var(--border-color);
-    }
-    
-    /* Make sure text is always readable */
-    .stMarkdown, .stText {
-        color: var(--text-color);
-    }
-    
-    /* Ensure selectboxes and inputs are visible */
-    .stSelectbox > div > div, .stTextInput > div > div > input {
-        border: 1px solid #ccc;
-    }
-    
-    /* Improve tab visibility */
-    .stTabs [data-baseweb="tab-list"] button {
-        border: 1px solid #ddd;
-        margin-right: 2px;
-    }
-    
-    .stTabs [data-baseweb="tab-list"] button[aria-selected="true"] {
-        border-bottom: 2px solid #1f77b4;
-        font-weight: bold;
-    }
-    </style>
-    """, unsafe_allow_html=True)
 
     # Load data
-    csv_data = load_available_data()
-    histogram_data = load_histogram_data()
+    master_fingerprint = get_master_fingerprint()
+    csv_data = load_available_data(master_fingerprint)
+    # One scan of histogram_outputs serves the loader, the PNG fallback and the Settings tab
+    histogram_files = scan_files("histogram_outputs")
+    histogram_fingerprint = get_histogram_fingerprint(histogram_files)
+    histogram_data = load_histogram_data(histogram_fingerprint)
+    # Display titles for every loaded category, built once per run
+    category_titles = {category: category.replace("_", " ").title() for category in {*csv_data, *histogram_data}}
 
     # Header with user info
     col1, col2 = st.columns([3, 1])
@@ -827,9 +936,7 @@ def main():
     with col2:
         username = st.session_state.get('username', 'Unknown')
         st.markdown(f"**👤 Logged in as: {username}**")
-        if st.button("🚪 Logout"):
-            logout()
-            st.rerun()
+        st.button("🚪 Logout", on_click=logout)
 
     # Sidebar
     with st.sidebar:
@@ -841,25 +948,16 @@ def main():
         
         with st.expander("Fetch New Data", expanded=False):
             st.text("Person ID")
-            person_id = st.text_input("Person ID", value="0197a976-e0dd-707e-8eef-104d3d3a24a5", label_visibility="collapsed")
+            st.text_input("Person ID", value="0197a976-e0dd-707e-8eef-104d3d3a24a5", key="person_id_input", label_visibility="collapsed")
             
-            if st.button("🔍 Browse Events"):
-                # Show loading state
-                with st.spinner("🔍 Searching for recent motor data events..."):
-                    # Store the person ID in session state and trigger event browsing
-                    st.session_state.person_id = person_id
-                    st.session_state.show_event_browser = True
-                    # Small delay to show the spinner
-                    import time
-                    time.sleep(0.5)
-                st.rerun()
+            st.button("🔍 Browse Events", on_click=open_event_browser)
         
         if st.button("📊 Generate Charts", use_container_width=True):
             # Try the main histogram generation script first
             success, output = run_histogram_generation()
             
-            # If that fails, try the backup method
-            if not success:
+            # If that fails, try the backup method (not when success is None: a run still writing the same files)
+            if success is False:
                 st.info("🔄 Trying backup chart generation method...")
                 backup_success, backup_output = generate_charts_from_master_csv()
                 if backup_success:
@@ -869,42 +967,37 @@ def main():
                     st.error(f"❌ Backup method also failed: {backup_output}")
             
             if success:
+                load_histogram_data.clear()
                 st.rerun()
     
     # Clear Data Section
     with st.sidebar.expander("🗑️ Clear Data", expanded=False):
-        st.markdown("**⚠️ Warning**: This will delete all downloaded data and charts.")
+        st.markdown("**⚠️ Warning**: This will delete everything in `csv_outputs/` and `histogram_outputs/`, including all downloaded data and charts.")
         
         # Show what would be cleared
-        csv_files = glob.glob("csv_outputs/*.csv")
-        histogram_files = glob.glob("histogram_outputs/*")
-        total_files = len(csv_files) + len([f for f in histogram_files if os.path.isfile(f)])
+        total_files = count_output_files(get_output_dirs_fingerprint())
         
         if total_files > 0:
-            st.info(f"📁 {total_files} files will be deleted")
+            st.info(f"📁 {total_files} items will be deleted")
             
             if st.button("🗑️ Clear All Data", use_container_width=True, type="primary"):
-                cleared_files = []
-                
-                # Clear CSV files
-                for file in csv_files:
+                # Remove each output directory in one call and recreate it empty
+                failed_dirs = []
+                for d in OUTPUT_DIRS:
                     try:
-                        os.remove(file)
-                        cleared_files.append(os.path.basename(file))
+                        shutil.rmtree(d)
+                    except FileNotFoundError:
+                        pass
                     except Exception as e:
-                        st.error(f"Could not delete {file}: {e}")
-                
-                # Clear histogram files
-                for file in histogram_files:
-                    if os.path.isfile(file):
-                        try:
-                            os.remove(file)
-                            cleared_files.append(os.path.basename(file))
-                        except Exception as e:
-                            st.error(f"Could not delete {file}: {e}")
+                        failed_dirs.append(d)
+                        st.error(f"Could not delete {d}: {e}")
+                    os.makedirs(d, exist_ok=True)
                 
-                if cleared_files:
-                    st.success(f"✅ Cleared {len(cleared_files)} files")
+                load_available_data.clear()
+                load_histogram_data.clear()
+                # Only rerun when everything was removed, so any error above stays visible
+                if not failed_dirs:
+                    st.success(f"✅ Cleared {total_files} items")
                     st.rerun()
         else:
             st.info("ℹ️ No data files to clear")
@@ -921,33 +1014,27 @@ def main():
         
         person_id = st.session_state.get('person_id', '0197a976-e0dd-707e-8eef-104d3d3a24a5')
         
-        with st.spinner("🔍 Fetching recent events..."):
-            success, events = fetch_events_list(person_id)
+        # Reuse the listing kept for this person so page changes don't fetch it again
+        listing = st.session_state.get('event_listing')
+        if listing and listing[0] == person_id:
+            success, events = True, listing[1]
+        else:
+            with st.spinner("🔍 Fetching recent events..."):
+                success, events = fetch_events_list(person_id)
+            if success:
+                st.session_state.event_listing = (person_id, events)
         
         if success and events:
             # Initialize pagination state
             if 'event_page' not in st.session_state:
                 st.session_state.event_page = 0
             
-            # Convert the parsed events to a more structured format (show all events)
-            formatted_events = []
-            all_events = events  # Show all events, not just those with specific property counts
-            
-            for i, event in enumerate(all_events, 1):
-                formatted_events.append({
-                    'number': str(i),
-                    'timestamp': event['timestamp'],
-                    'session_id': event['session_id'],
-                    'properties_count': event['properties_count'],
-                    'details': event.get('line', '')
-                })
-            
-            # Show event count info
-            st.info(f"📋 Showing all {len(all_events)} available Motor Data events")
+            # Show event count info (all events, not just those with specific property counts)
+            st.info(f"📋 Showing all {len(events)} available Motor Data events")
             
             # Pagination settings
             events_per_page = 10
-            total_events = len(formatted_events)
+            total_events = len(events)
             total_pages = (total_events + events_per_page - 1) // events_per_page  # Ceiling division
             current_page = st.session_state.event_page
             
@@ -959,7 +1046,19 @@ def main():
             # Calculate start and end indices for current page
             start_idx = current_page * events_per_page
             end_idx = min(start_idx + events_per_page, total_events)
-            current_events = formatted_events[start_idx:end_idx]
+            # Structure only the shown page's events; timestamps are formatted in one vectorized pass
+            page_events = events[start_idx:end_idx]
+            page_timestamps = format_timestamps_readable([event['timestamp'] for event in page_events])
+            current_events = [
+                {
+                    'number': str(i),
+                    'timestamp': event['timestamp'],
+                    'session_id': event['session_id'],
+                    'properties_count': event['properties_count'],
+                    'pretty_ts': pretty_ts,
+                }
+                for i, (event, pretty_ts) in enumerate(zip(page_events, page_timestamps), start_idx + 1)
+            ]
             
             # Pagination controls at the top
             st.markdown("### 📄 Page Navigation")
@@ -967,27 +1066,23 @@ def main():
             col1, col2, col3, col4, col5 = st.columns([1, 1, 2, 1, 1])
             
             with col1:
-                if st.button("⏮️ First", disabled=(current_page == 0), key="first_page_top"):
-                    st.session_state.event_page = 0
-                    st.rerun()
+                st.button("⏮️ First", disabled=(current_page == 0), key="first_page_top",
+                          on_click=set_event_page, args=(0,))
             
             with col2:
-                if st.button("◀️ Previous", disabled=(current_page == 0), key="prev_page_top"):
-                    st.session_state.event_page = max(0, current_page - 1)
-                    st.rerun()
+                st.button("◀️ Previous", disabled=(current_page == 0), key="prev_page_top",
+                          on_click=set_event_page, args=(max(0, current_page - 1),))
             
             with col3:
                 st.markdown(f"**Page {current_page + 1} of {total_pages}** (Events {start_idx + 1}-{end_idx} of {total_events})")
             
             with col4:
-                if st.button("Next ▶️", disabled=(current_page >= total_pages - 1), key="next_page_top"):
-                    st.session_state.event_page = min(total_pages - 1, current_page + 1)
-                    st.rerun()
+                st.button("Next ▶️", disabled=(current_page >= total_pages - 1), key="next_page_top",
+                          on_click=set_event_page, args=(min(total_pages - 1, current_page + 1),))
             
             with col5:
-                if st.button("Last ⏭️", disabled=(current_page >= total_pages - 1), key="last_page_top"):
-                    st.session_state.event_page = total_pages - 1
-                    st.rerun()
+                st.button("Last ⏭️", disabled=(current_page >= total_pages - 1), key="last_page_top",
+                          on_click=set_event_page, args=(total_pages - 1,))
             
             # Modern section header
             st.markdown("""
@@ -998,43 +1093,36 @@ def main():
             </div>
             """, unsafe_allow_html=True)
             
-            # Create individual event cards instead of a table
-            for i, event in enumerate(current_events):
+            # One selectable table for the page instead of a button per event
+            events_df = pd.DataFrame({
+                '#': [int(event['number']) for event in current_events],
+                'Timestamp (PT)': [event['pretty_ts'] for event in current_events],
+                'Properties': [event['properties_count'] for event in current_events],
+            })
+            table_key = f"events_table_page_{current_page}_{st.session_state.get('events_table_version', 0)}"
+            st.dataframe(
+                events_df,
+                key=table_key,
+                on_select=partial(select_event_row, table_key, current_events),
+                selection_mode="single-row",
+                hide_index=True,
+                use_container_width=True
+            )
+            st.caption("Click a row to download that event")
+            
+            # The event was resolved when the row was clicked, so a refreshed listing can't shift it
+            event = st.session_state.pop('pending_event_download', None)
+            if event is not None:
                 event_num = event['number']
-                timestamp = event['timestamp']
-                formatted_time = format_timestamp_readable(timestamp)
-                properties_count = event['properties_count']
-                
-                # Create a unique key for each button
-                button_key = f"download_event_{event_num}_page_{current_page}"
-                
-                # Event card with clickable download
-                col1, col2 = st.columns([4, 1])
-                
-                with col1:
-                    # Main event button with all info displayed
-                    if st.button(
-                        f"📥 Event {event_num}: {formatted_time} • {properties_count} properties",
-                        key=button_key,
-                        use_container_width=True,
-                        type="primary" if i == 0 else "secondary",
-                        help=f"Click to download Event {event_num} motor data"
-                    ):
-                        with st.spinner(f"📥 Downloading Event {event_num}..."):
-                            success, output = fetch_specific_event_data(person_id, timestamp)
-                        
-                        if success:
-                            st.session_state.show_event_browser = False
-                            if 'event_page' in st.session_state:
-                                del st.session_state.event_page  # Reset pagination
-                            st.rerun()
-                        else:
-                            st.error(f"❌ Download failed: {output}")
-                            st.info("💡 Try refreshing the list or check your connection.")
+                with st.spinner(f"📥 Downloading Event {event_num}..."):
+                    success, output = fetch_specific_event_data(person_id, event['timestamp'])
                 
-                with col2:
-                    # Show event number prominently
-                    st.markdown(f"**Event {event_num}**")
+                if success:
+                    close_event_browser()
+                    st.rerun()
+                else:
+                    st.error(f"❌ Download failed: {output}")
+                    st.info("💡 Try refreshing the list or check your connection.")
             
             # Control buttons section
             st.markdown("---")
@@ -1043,17 +1131,12 @@ def main():
             col1, col2 = st.columns([1, 1])
             
             with col1:
-                if st.button("🔙 Back to Dashboard", use_container_width=True, help="Return to main dashboard"):
-                    st.session_state.show_event_browser = False
-                    if 'event_page' in st.session_state:
-                        del st.session_state.event_page  # Reset pagination
-                    st.rerun()
+                st.button("🔙 Back to Dashboard", use_container_width=True, help="Return to main dashboard",
+                          on_click=close_event_browser)
             
             with col2:
-                if st.button("🔄 Refresh", use_container_width=True, help="Refresh the event list"):
-                    if 'event_page' in st.session_state:
-                        del st.session_state.event_page  # Reset pagination
-                    st.rerun()
+                st.button("🔄 Refresh", use_container_width=True, help="Refresh the event list",
+                          on_click=refresh_event_list)
             
             # Bulk download section
             st.markdown("---")
@@ -1069,9 +1152,7 @@ def main():
                         success, output = fetch_bulk_events(person_id, event_count=5)
                     
                     if success:
-                        st.session_state.show_event_browser = False
-                        if 'event_page' in st.session_state:
-                            del st.session_state.event_page  # Reset pagination
+                        close_event_browser()
                         st.rerun()
                     else:
                         st.error(f"❌ Bulk download failed: {output}")
@@ -1090,9 +1171,7 @@ def main():
                             success, output = fetch_bulk_events(person_id, event_count=None)
                         
                         if success:
-                            st.session_state.show_event_browser = False
-                            if 'event_page' in st.session_state:
-                                del st.session_state.event_page  # Reset pagination
+                            close_event_browser()
                             st.rerun()
                         else:
                             st.error(f"❌ Bulk download failed: {output}")
@@ -1107,30 +1186,21 @@ def main():
                     if st.button(f"📥 Get Current Page ({events_on_page} events)", use_container_width=True, type="secondary",
                                help=f"Download all {events_on_page} events from the current page"):
                         with st.spinner(f"📥 Downloading {events_on_page} events from current page..."):
-                            # Use bulk download approach for consistency
-                            success_count = 0
-                            for event in current_events:
-                                event_success, _ = fetch_specific_event_data(person_id, event['timestamp'])
-                                if event_success:
-                                    success_count += 1
+                            # Download the page's events through the bulk path (one PostHog listing)
+                            success, output = fetch_bulk_events(person_id, events=current_events)
                         
-                        if success_count > 0:
-                            st.success(f"✅ Downloaded {success_count}/{events_on_page} events from current page!")
-                            st.session_state.show_event_browser = False
-                            if 'event_page' in st.session_state:
-                                del st.session_state.event_page  # Reset pagination
+                        if success:
+                            close_event_browser()
                             st.rerun()
                         else:
-                            st.error("❌ Failed to download any events from current page")
+                            st.error(f"❌ Failed to download any events from current page: {output}")
                 else:
                     st.button("📥 Current Page", disabled=True, use_container_width=True, 
                             help="No events on current page")
 
         else:
             st.error("❌ No events found in the output")
-            if st.button("🔙 Back to Dashboard"):
-                st.session_state.show_event_browser = False
-                st.rerun()
+            st.button("🔙 Back to Dashboard", on_click=close_event_browser)
         
         return  # Don't show the main dashboard when browsing events
     
@@ -1141,64 +1211,29 @@ def main():
         st.header("📊 Data Overview")
         
         if csv_data:
-            # Summary information as simple text
-            col1, col2, col3, col4 = st.columns(4)
+            summary = get_overview_summary(master_fingerprint)
+            total_properties = summary['total_properties']
+            latest_timestamp = summary['latest_timestamp']
+            charts_count = len(histogram_data) if histogram_data else 0
             
-            with col1:
-                st.markdown("**📁 Data Categories**")
-                st.markdown(f"**{len(csv_data)}**")
-            
-            with col2:
-                total_properties = sum(len(df.columns) - 1 for df in csv_data.values())  # -1 for timestamp
-                st.markdown("**🔧 Total Properties**")
-                st.markdown(f"**{total_properties}**")
+            # Show timestamp of latest data
+            latest_str = html.escape(str(latest_timestamp)[:16]) if latest_timestamp else "Unknown"
             
-            with col3:
-                if histogram_data:
-                    st.markdown("**📊 Generated Charts**")
-                    st.markdown(f"**{len(histogram_data)}**")
-                else:
-                    st.markdown("**📊 Generated Charts**")
-                    st.markdown("**0**")
-            
-            with col4:
-                # Show timestamp of latest data
-                latest_timestamp = None
-                for df in csv_data.values():
-                    if 'timestamp' in df.columns and not df.empty:
-                        latest_timestamp = df['timestamp'].iloc[0]
-                        break
-                
-                if latest_timestamp:
-                    st.markdown("**🕐 Latest Data**")
-                    st.markdown(f"**{latest_timestamp[:16]}**")
-                else:
-                    st.markdown("**🕐 Latest Data**")
-                    st.markdown("**Unknown**")
+            # Summary information as a single HTML block (one element instead of eight)
+            st.markdown(f"""
+            <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem;">
+                <div><b>📁 Data Categories</b><br><b>{len(csv_data)}</b></div>
+                <div><b>🔧 Total Properties</b><br><b>{total_properties}</b></div>
+                <div><b>📊 Generated Charts</b><br><b>{charts_count}</b></div>
+                <div><b>🕐 Latest Data</b><br><b>{latest_str}</b></div>
+            </div>
+            """, unsafe_allow_html=True)
         
         # Show available data categories
         st.subheader("Available Data Categories")
         
         if csv_data:
-            # Get master CSV file size
-            master_csv_file = "csv_outputs/motor_data_master.csv"
-            master_size = 0
-            try:
-                if os.path.exists(master_csv_file):
-                    master_size = os.path.getsize(master_csv_file) / 1024
-            except (FileNotFoundError, OSError):
-                master_size = 0
-            
-            categories_df = pd.DataFrame([
-                {
-                    "Category": category.replace("_", " ").title(),
-                    "Properties": len(df.columns) - 1,  # -1 for timestamp
-                    "Rows": len(df),
-                    "Master CSV Size": f"{master_size:.1f} KB" if master_size > 0 else "N/A"
-                }
-                for category, df in csv_data.items()
-            ])
-            
+            categories_df = build_categories_table(master_fingerprint)
             st.dataframe(categories_df, use_container_width=True, hide_index=True)
         else:
             st.info("No CSV data available")
@@ -1207,59 +1242,51 @@ def main():
         st.header("📈 Interactive Data Visualization")
         
         if histogram_data:
+            histogram_stats = compute_histogram_stats(histogram_fingerprint)
+            # Each chart is keyed on its source file's (mtime, size), so no pass over the data is needed
+            figure_sigs = {
+                os.path.basename(path).replace("_numeric_values.csv", ""): (mtime, size)
+                for path, mtime, size in histogram_fingerprint
+            }
+            
             # Display all charts automatically
-            for category in histogram_data.keys():
-                st.subheader(f"{category.replace('_', ' ').title()} Analysis")
-                
-                df = histogram_data[category]
+            for category, df in histogram_data.items():
+                st.subheader(f"{category_titles[category]} Analysis")
                 
                 # Create columns for chart and stats
                 col1, col2 = st.columns([3, 1])
                 
                 with col1:
-                    fig = create_interactive_histogram(df, category)
-                    st.plotly_chart(fig, use_container_width=True)
+                    fig = get_histogram_figure(df, category, figure_sigs[category])
+                    st.plotly_chart(fig, use_container_width=True, key=f"hist_{category}")
                 
                 with col2:
+                    stats = histogram_stats[category]
                     st.markdown("**📊 Statistics**")
-                    st.markdown(f"**Min Value:** {df['Value'].min():.1f}")
-                    st.markdown(f"**Max Value:** {df['Value'].max():.1f}")
-                    st.markdown(f"**Average:** {df['Value'].mean():.1f}")
-                    st.markdown(f"**Properties:** {len(df)}")
+                    st.markdown(f"**Min Value:** {stats['min']:.1f}")
+                    st.markdown(f"**Max Value:** {stats['max']:.1f}")
+                    st.markdown(f"**Average:** {stats['mean']:.1f}")
+                    st.markdown(f"**Properties:** {stats['count']}")
                     
                     # Show min/max properties
-                    min_idx = df['Value'].idxmin()
-                    max_idx = df['Value'].idxmax()
-                    
                     st.markdown("**🔍 Extremes**")
-                    st.markdown(f"**Min:** Index {df.loc[min_idx, 'Numeric_Label']}")
-                    st.markdown(f"**Max:** Index {df.loc[max_idx, 'Numeric_Label']}")
+                    st.markdown(f"**Min:** Index {stats['min_label']}")
+                    st.markdown(f"**Max:** Index {stats['max_label']}")
                 
                 st.divider()
         else:
             st.warning("⚠️ No interactive histogram data available. Generate charts using the sidebar.")
             
             # Show static images if available as fallback
-            png_patterns = [
-                "histogram_outputs/*.png",
-                "./histogram_outputs/*.png",
-                os.path.join(os.getcwd(), "histogram_outputs", "*.png")
-            ]
-            
-            png_files = []
-            for pattern in png_patterns:
-                files = glob.glob(pattern)
-                if files:
-                    png_files = files
-                    break
+            png_files = [entry for entry in histogram_files if entry[0].endswith(".png")]
             
             if png_files:
                 st.info("📸 Static histogram images found:")
-                for png_file in sorted(png_files):
-                    category = os.path.basename(png_file).replace("_numeric_values.png", "")
+                for png_name, png_file, png_stat in sorted(png_files):
+                    category = png_name.replace("_numeric_values.png", "")
                     st.subheader(f"{category.replace('_', ' ').title()}")
                     try:
-                        st.image(png_file)
+                        st.image(load_image_bytes(png_file, png_stat.st_mtime))
                     except Exception as e:
                         st.error(f"Could not load image: {png_file}")
             else:
@@ -1272,39 +1299,36 @@ def main():
             # Category selector for raw data
             selected_category = st.selectbox(
                 "Select a category to explore:",
-                options=list(csv_data.keys()),
-                format_func=lambda x: x.replace("_", " ").title()
+                options=list(csv_data),
+                format_func=category_titles.get
             )
             
             if selected_category:
                 df = csv_data[selected_category]
                 
-                st.subheader(f"Raw Data: {selected_category.replace('_', ' ').title()}")
+                st.subheader(f"Raw Data: {category_titles[selected_category]}")
                 
-                # Show data info as simple text
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.markdown("**Rows**")
-                    st.markdown(f"**{len(df)}**")
-                with col2:
-                    st.markdown("**Columns**")
-                    st.markdown(f"**{len(df.columns)}**")
-                with col3:
-                    st.markdown("**Timestamp**")
-                    if 'timestamp' in df.columns:
-                        timestamp_val = df['timestamp'].iloc[0] if not df.empty else "N/A"
-                        st.markdown(f"**{timestamp_val}**")
-                    else:
-                        st.markdown("**N/A**")
+                # Show data info as a single HTML block
+                if 'timestamp' in df.columns:
+                    timestamp_val = html.escape(str(df['timestamp'].iat[0])) if not df.empty else "N/A"
+                else:
+                    timestamp_val = "N/A"
+                
+                st.markdown(f"""
+                <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;">
+                    <div><b>Rows</b><br><b>{len(df)}</b></div>
+                    <div><b>Columns</b><br><b>{len(df.columns)}</b></div>
+                    <div><b>Timestamp</b><br><b>{timestamp_val}</b></div>
+                </div>
+                """, unsafe_allow_html=True)
                 
                 # Display data
                 st.dataframe(df, use_container_width=True, hide_index=True)
                 
                 # Download button
-                csv = df.to_csv(index=False)
                 st.download_button(
                     label=f"📥 Download {selected_category}.csv",
-                    data=csv,
+                    data=get_category_csv_bytes(master_fingerprint, selected_category),
                     file_name=f"{selected_category}_data.csv",
                     mime="text/csv"
                 )
@@ -1321,29 +1345,26 @@ def main():
         
         with col1:
             st.markdown("**CSV Data Files:**")
-            csv_files = glob.glob("csv_outputs/*.csv")
+            csv_files = scan_files("csv_outputs", ".csv")
             if csv_files:
-                for file in sorted(csv_files):
-                    size = os.path.getsize(file) / 1024
-                    st.text(f"📄 {os.path.basename(file)} ({size:.1f} KB)")
+                # One element for the whole listing instead of one per file
+                st.text("\n".join(f"📄 {name} ({stat.st_size / 1024:.1f} KB)" for name, _, stat in sorted(csv_files)))
             else:
                 st.text("No CSV files found")
         
         with col2:
             st.markdown("**Histogram Files:**")
-            hist_files = glob.glob("histogram_outputs/*")
-            if hist_files:
-                for file in sorted(hist_files):
-                    if os.path.isfile(file):
-                        size = os.path.getsize(file) / 1024
-                        st.text(f"📊 {os.path.basename(file)} ({size:.1f} KB)")
+            if histogram_files:
+                st.text("\n".join(f"📊 {name} ({stat.st_size / 1024:.1f} KB)" for name, _, stat in sorted(histogram_files)))
             else:
                 st.text("No histogram files found")
         
         st.subheader("🔧 System Information")
-        st.text(f"Python Version: {sys.version}")
-        st.text(f"Working Directory: {os.getcwd()}")
-        st.text(f"Streamlit Version: {st.__version__}")
+        st.text(
+            f"Python Version: {sys.version}\n"
+            f"Working Directory: {os.getcwd()}\n"
+            f"Streamlit Version: {st.__version__}"
+        )
         
         st.subheader("📖 About")
         st.markdown("""